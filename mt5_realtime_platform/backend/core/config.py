@@ -4,35 +4,52 @@ Configuration settings for MT5 Real-Time Analytics Platform
 """
 
 import os
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Tuple
 
+def _env(name: str, default: str, secret: bool = False):
+    """Read an environment variable when the settings object is built; secrets are kept out of repr()"""
+    return field(default_factory=lambda: os.getenv(name, default), repr=not secret)
+
+def _env_list(name: str, default: str):
+    """Read a comma-separated environment variable as a tuple"""
+    return field(default_factory=lambda: tuple(os.getenv(name, default).split(',')))
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings"""
-    
-    def __init__(self):
-        # JWT Configuration
-        self.JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'your-super-secret-jwt-key-change-in-production')
-        self.ALGORITHM = 'HS256'
-        self.ACCESS_TOKEN_EXPIRE_MINUTES = 30
-        
-        # Database
-        self.DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./data/mt5_analytics.db')
-        
-        # MT5 Configuration
-        self.MT5_LIVE_LOGIN = os.getenv('MT5_LIVE_LOGIN', '165835373')
-        self.MT5_LIVE_PASSWORD = os.getenv('MT5_LIVE_PASSWORD', 'Manan@123!!')
-        self.MT5_LIVE_SERVER = os.getenv('MT5_LIVE_SERVER', 'XMGlobal-MT5 2')
-        self.MT5_SYMBOLS = os.getenv('MT5_SYMBOLS', 'XAUUSD,GOLD,EURUSD,GBPUSD').split(',')
-        
-        # API Configuration
-        self.API_HOST = os.getenv('API_HOST', '0.0.0.0')
-        self.API_PORT = int(os.getenv('API_PORT', '8000'))
-        
-        # CORS
-        self.ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', 'http://localhost:3000,http://localhost:8000').split(',')
-        
-        # Environment
-        self.ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
-        self.DEBUG = os.getenv('DEBUG', 'true').lower() == 'true'
+
+    # JWT Configuration
+    JWT_SECRET_KEY: str = _env('JWT_SECRET_KEY', 'your-super-secret-jwt-key-change-in-production', secret=True)
+    ALGORITHM: str = 'HS256'
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    # Database
+    DATABASE_URL: str = _env('DATABASE_URL', 'sqlite:///./data/mt5_analytics.db')
+
+    # MT5 Configuration
+    MT5_LIVE_LOGIN: str = _env('MT5_LIVE_LOGIN', '165835373', secret=True)
+    MT5_LIVE_PASSWORD: str = _env('MT5_LIVE_PASSWORD', 'Manan@123!!', secret=True)
+    MT5_LIVE_SERVER: str = _env('MT5_LIVE_SERVER', 'XMGlobal-MT5 2')
+    MT5_SYMBOLS: Tuple[str, ...] = _env_list('MT5_SYMBOLS', 'XAUUSD,GOLD,EURUSD,GBPUSD')
+
+    # API Configuration
+    API_HOST: str = _env('API_HOST', '0.0.0.0')
+    API_PORT: int = field(default_factory=lambda: int(os.getenv('API_PORT', '8000')))
+
+    # CORS
+    ALLOWED_ORIGINS: Tuple[str, ...] = _env_list('ALLOWED_ORIGINS', 'http://localhost:3000,http://localhost:8000')
+
+    # Environment
+    ENVIRONMENT: str = _env('ENVIRONMENT', 'development')
+    DEBUG: bool = field(default_factory=lambda: os.getenv('DEBUG', 'true').lower() == 'true')
+
+    @classmethod
+    @cache
+    def load(cls) -> "Settings":
+        """Build settings from the environment once and reuse them"""
+        return cls()
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = Settings.load()
@@ -5,67 +5,119 @@ Manages WebSocket connections and broadcasts REAL MT5 data
 """
 
 import asyncio
-import json
 import logging
-from typing import List, Dict, Any
+from collections import Counter, defaultdict
+from typing import Set, Dict, Any
 from fastapi import WebSocket
 from datetime import datetime
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Serialize numpy values and non-string keys natively; anything else falls back to str()
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Frames buffered per connection before the oldest is dropped
+MAX_QUEUE_SIZE = 256
+
+# Most frames coalesced into a single batch frame
+MAX_BATCH_SIZE = 128
+
+def dumps_message(message: Dict[str, Any]) -> str:
+    """Serialize a message to a JSON text frame"""
+    return orjson.dumps(message, default=str, option=ORJSON_OPTIONS).decode()
+
 class WebSocketManager:
     """Manages WebSocket connections and broadcasting"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.connection_data: Dict[WebSocket, Dict] = {}
+        self.active_connections: Set[WebSocket] = set()
+        self.connected_at: Dict[WebSocket, datetime] = {}
+        self.message_counts: Counter = Counter()
+        self.queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.subscriptions: Dict[str, Set[WebSocket]] = defaultdict(set)
+        self.latest_frames: Dict[str, str] = {}
         
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        self.connection_data[websocket] = {
-            'connected_at': datetime.utcnow(),
-            'message_count': 0
-        }
+        self.active_connections.add(websocket)
+        self.connected_at[websocket] = datetime.utcnow()
+        self.message_counts[websocket] = 0
+        self.queues[websocket] = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
         
     async def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if websocket in self.connection_data:
-            del self.connection_data[websocket]
+        self.active_connections.discard(websocket)
+        self.connected_at.pop(websocket, None)
+        self.message_counts.pop(websocket, None)
+        self.queues.pop(websocket, None)
+        for topic, subscribers in self.subscriptions.items():
+            subscribers.discard(websocket)
+            # Publishers skip topics nobody listens to, so the cached frame would go stale
+            if not subscribers:
+                self.latest_frames.pop(topic, None)
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
         
+    async def subscribe(self, websocket: WebSocket, topic: str):
+        """Subscribe a connection to a published topic"""
+        self.subscriptions[topic].add(websocket)
+        
+        # Send the last published frame right away instead of waiting for the next tick
+        latest = self.latest_frames.get(topic)
+        if latest is not None:
+            self.enqueue(websocket, latest)
+        
+    def has_subscribers(self, topic: str) -> bool:
+        """Check whether anyone is listening on a topic"""
+        return bool(self.subscriptions.get(topic))
+        
+    async def publish(self, topic: str, message: Dict[str, Any]):
+        """Serialize a message once and queue it for every subscriber of a topic"""
+        message_str = dumps_message(message)
+        self.latest_frames[topic] = message_str
+        
+        for websocket in self.subscriptions.get(topic, ()):
+            self.enqueue(websocket, message_str)
+        
+    def enqueue(self, websocket: WebSocket, frame: str):
+        """Queue a serialized frame for a connection, dropping the oldest if it is backed up"""
+        queue = self.queues.get(websocket)
+        if queue is None:
+            return
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(frame)
+        
+    async def stream(self, websocket: WebSocket):
+        """Send queued frames until the connection fails, coalescing any backlog into one frame"""
+        queue = self.queues[websocket]
+        while True:
+            frames = [await queue.get()]
+            while len(frames) < MAX_BATCH_SIZE and not queue.empty():
+                frames.append(queue.get_nowait())
+            
+            if len(frames) == 1:
+                await websocket.send_text(frames[0])
+            else:
+                # Frames are already JSON, so the batch is assembled without re-serializing
+                await websocket.send_text('{"type":"batch","messages":[' + ','.join(frames) + ']}')
+            self.message_counts[websocket] += len(frames)
+        
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """Send message to specific WebSocket"""
-        try:
-            await websocket.send_text(json.dumps(message, default=str))
-            self.connection_data[websocket]['message_count'] += 1
-        except Exception as e:
-            logger.error(f"Error sending message to WebSocket: {e}")
-            await self.disconnect(websocket)
+        self.enqueue(websocket, dumps_message(message))
             
     async def broadcast(self, message: Dict[str, Any]):
         """Broadcast message to all connected WebSockets"""
         if not self.active_connections:
             return
             
-        message_str = json.dumps(message, default=str)
-        disconnected = []
-        
+        # Serialize once; each connection's stream() task delivers at its own pace
+        message_str = dumps_message(message)
         for websocket in self.active_connections:
-            try:
-                await websocket.send_text(message_str)
-                self.connection_data[websocket]['message_count'] += 1
-            except Exception as e:
-                logger.error(f"Error broadcasting to WebSocket: {e}")
-                disconnected.append(websocket)
-                
-        # Clean up disconnected sockets
-        for websocket in disconnected:
-            await self.disconnect(websocket)
+            self.enqueue(websocket, message_str)
             
     def get_connection_count(self) -> int:
         """Get number of active connections"""
@@ -73,16 +125,15 @@ class WebSocketManager:
         
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics"""
-        total_messages = sum(data['message_count'] for data in self.connection_data.values())
         return {
             'active_connections': len(self.active_connections),
-            'total_messages_sent': total_messages,
+            'total_messages_sent': sum(self.message_counts.values()),
             'connections_data': [
                 {
-                    'connected_at': data['connected_at'].isoformat(),
-                    'message_count': data['message_count']
+                    'connected_at': connected_at.isoformat(),
+                    'message_count': self.message_counts[websocket]
                 }
-                for data in self.connection_data.values()
+                for websocket, connected_at in self.connected_at.items()
             ]
         }
 
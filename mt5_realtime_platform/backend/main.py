@@ -7,7 +7,7 @@ Production-ready API server with WebSocket streaming and authentication
 from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 import asyncio
 import json
 from datetime import datetime, timedelta
@@ -19,18 +19,7 @@ import sys
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-def serialize_datetime(obj):
-    """Helper function to serialize datetime objects for JSON"""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {key: serialize_datetime(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [serialize_datetime(item) for item in obj]
-    else:
-        return obj
-
-from models.database import engine, SessionLocal, Base
+from models.database import engine, Base, get_db
 from models.schemas import (
     UserCreate, UserResponse, StrategyConfig, EdgeData, 
     TickData, BarData, AlertRule
@@ -55,7 +44,8 @@ app = FastAPI(
     description="Production-ready SaaS platform for MetaTrader 5 statistical analysis",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend
@@ -81,8 +71,9 @@ async def startup_event():
     """Initialize services on startup"""
     logger.info("Starting MT5 Real-Time Analytics Platform...")
     
-    # Start MT5 connection
+    # Start MT5 connection and keep the singleton for request handlers
     mt5_service = await get_mt5_service()
+    app.state.mt5_service = mt5_service
     if await mt5_service.connect():
         logger.info("MT5 LIVE connection established!")
         # Start real-time data streaming
@@ -102,19 +93,11 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down services...")
-    await mt5_service.disconnect()
+    app.state.mt5_service.disconnect()
     await analytics_service.stop()
     await alert_service.stop()
     logger.info("Shutdown complete")
 
-# Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Dependency for authentication
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -151,29 +134,16 @@ async def root():
 @app.get("/health")
 async def health_check():
     """System health status"""
-    try:
-        mt5_service_instance = await get_mt5_service()
-        return {
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "services": {
-                "mt5_connected": mt5_service_instance.is_connected() if mt5_service_instance else False,
-                "analytics_running": True,
-                "alerts_active": True
-            },
-            "version": "1.0.0"
-        }
-    except Exception as e:
-        return {
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "services": {
-                "mt5_connected": True,
-                "analytics_running": True,
-                "alerts_active": True
-            },
-            "version": "1.0.0"
-        }
+    return {
+        "status": "healthy",
+        "timestamp": datetime.utcnow(),
+        "services": {
+            "mt5_connected": app.state.mt5_service.connected,
+            "analytics_running": True,
+            "alerts_active": True
+        },
+        "version": "1.0.0"
+    }
 
 # Authentication endpoints
 @app.post("/auth/register", response_model=UserResponse)
@@ -197,27 +167,14 @@ async def websocket_endpoint(websocket: WebSocket):
     """Real-time data streaming via WebSocket"""
     await websocket_manager.connect(websocket)
     try:
-        while True:
-            # Get latest analytics data
-            live_data = await analytics_service.get_live_data()
-            
-            # Serialize datetime objects
-            serialized_data = serialize_datetime(live_data)
-            
-            # Send to client
-            await websocket.send_json({
-                "type": "live_data",
-                "timestamp": datetime.utcnow().isoformat(),
-                **serialized_data  # Spread the serialized data directly
-            })
-            
-            # Wait for next update
-            await asyncio.sleep(1)  # 1 second updates
-            
+        # analytics_service publishes live_data once per second for all subscribers
+        await websocket_manager.subscribe(websocket, "live_data")
+        await websocket_manager.stream(websocket)
     except WebSocketDisconnect:
-        websocket_manager.disconnect(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
         await websocket_manager.disconnect(websocket)
 
 # Strategy edges WebSocket
@@ -226,20 +183,15 @@ async def edges_websocket(websocket: WebSocket):
     """Real-time statistical edge updates"""
     await websocket_manager.connect(websocket)
     try:
-        while True:
-            # Get latest edges
-            edges = await analytics_service.get_current_edges()
-            
-            await websocket.send_json({
-                "type": "edges_update",
-                "timestamp": datetime.utcnow().isoformat(),
-                "edges": edges
-            })
-            
-            await asyncio.sleep(5)  # 5 second updates for edges
-            
+        # analytics_service publishes edges_update every 5 seconds
+        await websocket_manager.subscribe(websocket, "edges")
+        await websocket_manager.stream(websocket)
     except WebSocketDisconnect:
-        websocket_manager.disconnect(websocket)
+        pass
+    except Exception as e:
+        logger.error(f"WebSocket error: {e}")
+    finally:
+        await websocket_manager.disconnect(websocket)
 
 # Market data endpoints
 @app.get("/api/v1/market/current-price")
@@ -248,13 +200,16 @@ async def get_current_price(
     current_user = Depends(get_current_user)
 ):
     """Get current market price for symbol"""
-    price_data = await mt5_service.get_current_price(symbol)
+    rates = await app.state.mt5_service.get_live_rates([symbol])
+    rate = rates.get(symbol)
+    if rate is None:
+        raise HTTPException(status_code=404, detail=f"No live price for {symbol}")
     return {
         "symbol": symbol,
-        "bid": price_data["bid"],
-        "ask": price_data["ask"],
-        "spread": price_data["spread"],
-        "timestamp": price_data["timestamp"]
+        "bid": rate["bid"],
+        "ask": rate["ask"],
+        "spread": rate["spread"],
+        "timestamp": rate["time"]
     }
 
 @app.get("/api/v1/market/bars")
@@ -265,7 +220,8 @@ async def get_historical_bars(
     current_user = Depends(get_current_user)
 ):
     """Get historical OHLCV bars"""
-    bars = await mt5_service.get_bars(symbol, timeframe, count)
+    df = await app.state.mt5_service.get_historical_bars(symbol, timeframe, count)
+    bars = df.reset_index().to_dict(orient="records")
     return {
         "symbol": symbol,
         "timeframe": timeframe,
@@ -288,7 +244,7 @@ async def get_statistical_edges(
         "timeframe": timeframe,
         "lookback_hours": lookback_hours,
         "edges": edges,
-        "calculated_at": datetime.utcnow().isoformat()
+        "calculated_at": datetime.utcnow()
     }
 
 @app.get("/api/v1/analytics/heatmap-data")
@@ -392,7 +348,7 @@ async def get_user_profile(current_user = Depends(get_current_user)):
         "id": current_user.id,
         "email": current_user.email,
         "plan": current_user.plan,
-        "created_at": current_user.created_at.isoformat(),
+        "created_at": current_user.created_at,
         "api_calls_today": await auth_service.get_api_usage(current_user.id),
         "rate_limit": current_user.rate_limit
     }
@@ -436,5 +392,13 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # uvloop/httptools ship with uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Server-push only: skip per-frame deflate, keep pings for dead-client detection
+        ws="websockets",
+        ws_per_message_deflate=False,
+        ws_ping_interval=20,
+        ws_ping_timeout=20
     )
\ No newline at end of file
@@ -4,9 +4,11 @@ Database models and connection setup for MT5 Real-Time Analytics Platform
 SQLAlchemy ORM models for users, strategies, bars, alerts, and analytics data
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import func
 from datetime import datetime
 import os
@@ -20,7 +22,28 @@ if DATABASE_URL.startswith('sqlite'):
     db_path = DATABASE_URL.replace('sqlite:///', '')
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-# Create engine with optimized settings
+# Async drivers for the database backends this app supports
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+def get_async_database_url(url: str) -> str:
+    """Rewrite a sync database URL to use its async driver"""
+    scheme, sep, rest = url.partition('://')
+    driver = ASYNC_DRIVERS.get(scheme.split('+', 1)[0])
+    if not sep or driver is None:
+        raise ValueError(f"Unsupported DATABASE_URL scheme for the async engine: {scheme!r}")
+    return f"{driver}://{rest}"
+
+def is_sqlite_memory_url(url: str) -> bool:
+    """Check for an in-memory SQLite database, which exists only on its one connection"""
+    return url.startswith('sqlite') and (':memory:' in url or url.rstrip('/').endswith(':'))
+
+# Async driver URL used by request handlers
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+
+# Create engine with optimized settings (schema creation and scripts)
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL debugging
@@ -29,8 +52,44 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
 )
 
-# Session factory
+# In-memory SQLite must share a single connection or each checkout sees an empty database
+if is_sqlite_memory_url(DATABASE_URL):
+    ASYNC_POOL_OPTIONS = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+elif DATABASE_URL.startswith('sqlite'):
+    # SQLite serializes writers on one file lock, so extra connections only add contention
+    ASYNC_POOL_OPTIONS = {"pool_size": 5, "max_overflow": 5}
+else:
+    ASYNC_POOL_OPTIONS = {
+        "pool_size": 20,  # Match concurrent request handlers instead of the default 5
+        "max_overflow": 40,
+        "pool_timeout": 5,  # Fail fast under overload rather than queueing for 30s
+    }
+
+# Async engine for FastAPI request handlers, so queries don't block the event loop
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    **ASYNC_POOL_OPTIONS
+)
+
+if DATABASE_URL.startswith('sqlite'):
+    @event.listens_for(engine, "connect")
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune SQLite for append-heavy bar/tick/usage writes"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")  # Readers don't block the writer
+        cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, far fewer fsyncs
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+        cursor.close()
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Base class for all models
 Base = declarative_base()
@@ -363,13 +422,10 @@ class SystemMetric(Base):
     )
 
 # Database utility functions
-def get_db():
-    """Dependency to get database session"""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Dependency to get async database session"""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 def init_database():
     """Initialize database with all tables"""
@@ -14,6 +14,7 @@ from scipy import stats
 import json
 
 from services.mt5_service import get_mt5_service
+from core.websocket_manager import websocket_manager
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,10 @@ class AnalyticsService:
         
         # Start background analysis
         asyncio.create_task(self._analysis_loop())
+        
+        # Publish live data and edges to WebSocket subscribers
+        asyncio.create_task(self._publish_live_data_loop())
+        asyncio.create_task(self._publish_edges_loop())
     
     async def stop(self):
         """Stop analytics"""
@@ -49,6 +54,36 @@ class AnalyticsService:
                 logger.error(f"Analytics loop error: {e}")
                 await asyncio.sleep(60)
     
+    async def _publish_live_data_loop(self):
+        """Publish one live data snapshot per second, shared by all subscribers"""
+        while self.running:
+            try:
+                if websocket_manager.has_subscribers("live_data"):
+                    live_data = await self.get_live_data()
+                    await websocket_manager.publish("live_data", {
+                        "type": "live_data",
+                        "timestamp": datetime.utcnow(),
+                        **live_data
+                    })
+            except Exception as e:
+                logger.error(f"Live data publish error: {e}")
+            await asyncio.sleep(1)
+    
+    async def _publish_edges_loop(self):
+        """Publish current edges every 5 seconds, shared by all subscribers"""
+        while self.running:
+            try:
+                if websocket_manager.has_subscribers("edges"):
+                    edges = await self.get_current_edges()
+                    await websocket_manager.publish("edges", {
+                        "type": "edges_update",
+                        "timestamp": datetime.utcnow(),
+                        "edges": edges
+                    })
+            except Exception as e:
+                logger.error(f"Edges publish error: {e}")
+            await asyncio.sleep(5)
+    
     async def analyze_all_patterns(self) -> Dict[str, Any]:
         """Analyze all patterns using real MT5 data"""
         try:
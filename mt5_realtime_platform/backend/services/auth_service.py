@@ -10,7 +10,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.database import User
 from models.schemas import UserCreate, UserResponse
@@ -38,10 +39,11 @@ class AuthService:
         """Generate secure API key"""
         return secrets.token_urlsafe(32)
         
-    async def create_user(self, user: UserCreate, db: Session) -> UserResponse:
+    async def create_user(self, user: UserCreate, db: AsyncSession) -> UserResponse:
         """Create new user account"""
         # Check if user exists
-        existing_user = db.query(User).filter(User.email == user.email).first()
+        result = await db.execute(select(User).where(User.email == user.email))
+        existing_user = result.scalars().first()
         if existing_user:
             raise ValueError("User already exists")
             
@@ -60,8 +62,8 @@ class AuthService:
         )
         
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         
         return UserResponse(
             id=db_user.id,
@@ -72,32 +74,34 @@ class AuthService:
             api_key=db_user.api_key
         )
         
-    async def verify_api_key(self, api_key: str, db: Session) -> Optional[User]:
+    async def verify_api_key(self, api_key: str, db: AsyncSession) -> Optional[User]:
         """Verify API key and return user"""
         if not api_key:
             return None
             
-        user = db.query(User).filter(
+        result = await db.execute(select(User).where(
             User.api_key == api_key,
             User.is_active == True
-        ).first()
+        ))
+        user = result.scalars().first()
         
         if user:
             # Update last login
             user.last_login = datetime.utcnow()
-            db.commit()
+            await db.commit()
             
         return user
         
-    async def refresh_api_key(self, user_id: int, db: Session) -> str:
+    async def refresh_api_key(self, user_id: int, db: AsyncSession) -> str:
         """Generate new API key for user"""
-        user = db.query(User).filter(User.id == user_id).first()
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalars().first()
         if not user:
             raise ValueError("User not found")
             
         new_api_key = self.generate_api_key()
         user.api_key = new_api_key
-        db.commit()
+        await db.commit()
         
         return new_api_key
         
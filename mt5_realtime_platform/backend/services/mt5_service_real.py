@@ -190,7 +190,7 @@ class MT5ServiceReal:
             # Calculate returns
             df['returns'] = df['close_price'].pct_change()
             df['hour'] = df.index.hour
-            df['day_of_week'] = df.index.day_name()
+            df['day_of_week'] = df.index.dayofweek  # Monday=0 .. Sunday=6
             df['minute'] = df.index.minute
             
             # Time-based analysis
@@ -219,9 +219,9 @@ class MT5ServiceReal:
             }).round(4)
             
             patterns['daily'] = {}
-            for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']:
-                if day in daily_stats.index:
-                    stats = daily_stats.loc[day]
+            for day_index, day in enumerate(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']):
+                if day_index in daily_stats.index:
+                    stats = daily_stats.loc[day_index]
                     patterns['daily'][day] = {
                         'sample_size': int(stats[('returns', 'count')]),
                         'avg_return': float(stats[('returns', 'mean')] * 100),